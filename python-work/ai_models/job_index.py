@@ -0,0 +1,226 @@
+# ai_models/job_index.py
+import bisect
+import json
+import os
+import re
+import time
+from collections import Counter
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+# Default location of the on-disk job index (one sub-directory per version)
+INDEX_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../models/job_index"))
+
+CURRENT_FILE = "CURRENT"
+VERSION_PATTERN = re.compile(r"^(\d{8}T\d{15})-(\d{6})$")
+ARRAYS = ("data", "indices", "indptr", "idf", "terms", "term_offsets")
+
+# Same tokenization as TfidfVectorizer's default token_pattern + lowercase
+TOKEN_PATTERN = re.compile(r"(?u)\b\w\w+\b")
+
+
+def build_job_index(jobs, root=INDEX_ROOT, keep=2):
+    """
+    Build the TF-IDF matrix for a job catalog and publish it as a new index version.
+    The CSR arrays, idf weights and sorted vocabulary are written as .npy files so
+    workers can memory-map them read-only instead of holding private copies.
+    :param jobs: list of dicts with 'title' and 'description'
+    :param root: index directory
+    :param keep: number of versions to keep on disk (older ones are removed)
+    :return: name of the published version
+    """
+    if keep < 1:
+        raise ValueError("keep must be at least 1.")
+
+    vectorizer = TfidfVectorizer()
+    matrix = vectorizer.fit_transform([job["description"] for job in jobs]).tocsr()
+    matrix.sort_indices()
+
+    # Re-number columns so the vocabulary can be stored sorted by its UTF-8 bytes
+    terms = sorted(vectorizer.vocabulary_, key=lambda t: t.encode("utf-8"))
+    order = np.array([vectorizer.vocabulary_[t] for t in terms], dtype=np.int64)
+    remap = np.empty_like(order)
+    remap[order] = np.arange(len(order))
+    matrix = csr_matrix((matrix.data, remap[matrix.indices], matrix.indptr), shape=matrix.shape)
+    matrix.sort_indices()
+
+    # Vocabulary as one UTF-8 blob + offsets, so a single long token doesn't pad every entry
+    encoded = [t.encode("utf-8") for t in terms]
+    term_offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(t) for t in encoded], out=term_offsets[1:])
+
+    version = new_version_name(root)
+    version_dir = os.path.join(root, version)
+    os.makedirs(version_dir)
+
+    # scipy downcasts (i.e. copies) int64 index arrays whose values fit in int32
+    index_dtype = np.int32 if max(matrix.nnz, matrix.shape[1]) < np.iinfo(np.int32).max else np.int64
+    arrays = {
+        "data": matrix.data.astype(np.float32),
+        "indices": matrix.indices.astype(index_dtype),
+        "indptr": matrix.indptr.astype(index_dtype),
+        "idf": vectorizer.idf_[order].astype(np.float32),
+        "terms": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+        "term_offsets": term_offsets,
+    }
+    for name, array in arrays.items():
+        np.save(os.path.join(version_dir, name + ".npy"), array)
+    with open(os.path.join(version_dir, "titles.json"), "w", encoding="utf-8") as f:
+        json.dump([job["title"] for job in jobs], f)
+
+    publish_version(root, version)
+    prune_versions(root, keep)
+    return version
+
+
+def new_version_name(root):
+    """
+    Name for a new version directory: a UTC timestamp (from one time_ns() read)
+    plus a counter. If the clock stepped back, the newest existing stamp is reused
+    with a higher counter, so names always sort after every existing version.
+    """
+    ns = time.time_ns()
+    stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime(ns // 1_000_000_000)) + f"{ns % 1_000_000_000:09d}"
+    counter = 0
+
+    existing = sorted(m.groups() for m in map(VERSION_PATTERN.match, os.listdir(root) if os.path.isdir(root) else []) if m)
+    if existing and stamp <= existing[-1][0]:
+        stamp, counter = existing[-1][0], int(existing[-1][1]) + 1
+    return f"{stamp}-{counter:06d}"
+
+
+def publish_version(root, version):
+    """
+    Point CURRENT at a fully written version directory. The pointer is replaced
+    atomically, so readers see either the old or the new version, never a partial one.
+    """
+    tmp_path = os.path.join(root, CURRENT_FILE + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(version)
+    os.replace(tmp_path, os.path.join(root, CURRENT_FILE))
+
+
+def prune_versions(root, keep):
+    """
+    Remove all but the newest `keep` version directories (names must sort by age).
+    The version CURRENT points at is never removed, whatever its name.
+    On Windows files still mapped or open in another process can't be deleted;
+    such versions are skipped and retried on the next prune.
+    """
+    if keep < 1:
+        raise ValueError("keep must be at least 1.")
+    versions = sorted(name for name in os.listdir(root) if os.path.isdir(os.path.join(root, name)))
+    live = current_version(root)
+    for name in versions[:-keep]:
+        if name == live:
+            continue
+        version_dir = os.path.join(root, name)
+        try:
+            for filename in os.listdir(version_dir):
+                os.remove(os.path.join(version_dir, filename))
+            os.rmdir(version_dir)
+        except PermissionError:
+            continue
+
+
+def current_version(root=INDEX_ROOT):
+    """Return the currently published version name, or None if no index was built."""
+    try:
+        with open(os.path.join(root, CURRENT_FILE), encoding="utf-8") as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+class _TermTable:
+    """Sorted vocabulary stored as a UTF-8 blob + offsets; supports len() and bisect."""
+
+    def __init__(self, blob, offsets):
+        self.blob = blob
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return self.blob[self.offsets[i]:self.offsets[i + 1]].tobytes()
+
+    def find(self, term):
+        """Column of `term` in the index, or -1 if it is not in the vocabulary."""
+        key = term.encode("utf-8")
+        i = bisect.bisect_left(self, key)
+        return i if i < len(self) and self[i] == key else -1
+
+
+class SharedJobIndex:
+    """
+    Read-only view of a published job index. Arrays are memory-mapped, so every
+    worker process attached to the same version shares one copy in the page cache.
+    """
+
+    def __init__(self, root=INDEX_ROOT):
+        self.root = root
+        self.version = None
+        self.refresh()
+
+    def refresh(self):
+        """
+        Attach to the latest published version if it changed.
+        :return: True if a new version was attached
+        """
+        version = current_version(self.root)
+        if version is None:
+            raise FileNotFoundError(f"No job index published in: {self.root}")
+        if version == self.version:
+            return False
+
+        version_dir = os.path.join(self.root, version)
+        arrays = {name: np.load(os.path.join(version_dir, name + ".npy"), mmap_mode="r") for name in ARRAYS}
+        with open(os.path.join(version_dir, "titles.json"), encoding="utf-8") as f:
+            titles = json.load(f)
+
+        self.terms = _TermTable(arrays["terms"], arrays["term_offsets"])
+        self.matrix = csr_matrix(
+            (arrays["data"], arrays["indices"], arrays["indptr"]),
+            shape=(len(titles), len(self.terms)),
+            copy=False,
+        )
+        self.idf = arrays["idf"]
+        self.titles = titles
+        self.version = version
+        return True
+
+    def transform(self, text):
+        """Turn text into an L2-normalized TF-IDF query vector over the index vocabulary."""
+        vector = np.zeros(len(self.terms), dtype=np.float32)
+        for token, count in Counter(TOKEN_PATTERN.findall(text.lower())).items():
+            column = self.terms.find(token)
+            if column >= 0:
+                vector[column] = count
+
+        vector *= self.idf
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def match(self, resume_input, top_n=3):
+        """
+        Match resume text or parsed dict against the indexed jobs (cosine similarity).
+        :param resume_input: raw text or dict with 'raw_text'
+        :param top_n: number of top job matches
+        :return: list of top matching jobs with scores
+        """
+        self.refresh()
+        resume_text = resume_input["raw_text"] if isinstance(resume_input, dict) else resume_input
+
+        scores = self.matrix @ self.transform(resume_text)
+        top = np.argsort(-scores, kind="stable")[:top_n]
+        return [{"job": self.titles[i], "score": float(scores[i])} for i in top]
+
+
+if __name__ == "__main__":
+    jobs_path = os.path.join(os.path.dirname(__file__), "../data/job_title.json")
+    with open(jobs_path, encoding="utf-8") as f:
+        jobs = json.load(f)
+    print(f"Published job index version: {build_job_index(jobs)}")
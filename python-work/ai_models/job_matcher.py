@@ -2,6 +2,7 @@
 # ai_models/job_matcher.py
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
+from ai_models import job_index
 
 # Example job database (you can later load from DB or CSV)
 JOB_LISTINGS = [
@@ -11,6 +12,21 @@ JOB_LISTINGS = [
     {"title": "Frontend Developer", "description": "React, JavaScript, HTML, CSS, UI/UX development"}
 ]
 
+# Memory-mapped job index shared by worker processes (see ai_models/job_index.py)
+_shared_index = None
+
+def get_shared_index():
+    """
+    Return the published shared job index, or None if none was built.
+    """
+    global _shared_index
+    root = job_index.INDEX_ROOT
+    if job_index.current_version(root) is None:
+        return None
+    if _shared_index is None or _shared_index.root != root:
+        _shared_index = job_index.SharedJobIndex(root)
+    return _shared_index
+
 def match_jobs(resume_input, top_n=3):
     """
     Match resume text or parsed dict with job descriptions using TF-IDF + cosine similarity.
@@ -18,6 +34,10 @@ def match_jobs(resume_input, top_n=3):
     :param top_n: number of top job matches
     :return: list of top matching jobs with scores
     """
+    index = get_shared_index()
+    if index is not None:
+        return index.match(resume_input, top_n=top_n)
+
     resume_text = resume_input["raw_text"] if isinstance(resume_input, dict) else resume_input
 
     corpus = [resume_text] + [job["description"] for job in JOB_LISTINGS]
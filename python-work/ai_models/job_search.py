@@ -0,0 +1,284 @@
+# ai_models/job_search.py
+import base64
+import bisect
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+from collections import Counter, defaultdict
+
+import numpy as np
+
+JOBS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "../data/job_title.json"))
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+REMOTE = "remote"
+
+# BM25 parameters; title tokens count TITLE_WEIGHT times towards term frequency
+K1 = 1.2
+B = 0.75
+TITLE_WEIGHT = 2
+
+
+def tokenize(text):
+    """Lowercase and split text into search tokens."""
+    return TOKEN_PATTERN.findall(text.lower()) if isinstance(text, str) else []
+
+
+def normalize_location(location):
+    """Normalize a location string for facet lookups ('' if missing)."""
+    return " ".join(tokenize(location))
+
+
+def load_jobs(path=JOBS_PATH):
+    """Load job postings from a job_title.json-style file."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _query_key(terms, location):
+    """Short digest identifying a search, so a cursor can't be replayed on another one."""
+    raw = json.dumps([terms, normalize_location(location)]).encode("utf-8")
+    return hashlib.sha1(raw).hexdigest()[:16]
+
+
+def _encode_cursor(score, doc_id, query_key):
+    raw = json.dumps([score, doc_id, query_key]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_cursor(cursor, query_key):
+    try:
+        score, doc_id, cursor_key = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        score, doc_id = float(score), int(doc_id)
+    except (ValueError, TypeError):
+        raise ValueError(f"Invalid search cursor: {cursor!r}")
+    if cursor_key != query_key:
+        raise ValueError("Search cursor belongs to a different search.")
+    return score, doc_id
+
+
+class JobSearchIndex:
+    """
+    In-memory search index over job postings ('title', 'description' and optional
+    'location' / 'remote' fields). Postings carry precomputed BM25 weights, so a
+    query is a sum of a few numpy arrays followed by a partial top-k selection.
+    """
+
+    def __init__(self, jobs):
+        self.jobs = list(jobs)
+        n_docs = len(self.jobs)
+
+        term_freqs = defaultdict(list)
+        doc_lengths = np.zeros(n_docs, dtype=np.float32)
+        title_terms = Counter()
+        locations = {}
+        location_codes = np.zeros(n_docs, dtype=np.int32)
+        remote = np.zeros(n_docs, dtype=bool)
+
+        for doc_id, job in enumerate(self.jobs):
+            title_tokens = tokenize(job.get("title", ""))
+            counts = Counter(tokenize(job.get("description", "")))
+            for token in title_tokens:
+                counts[token] += TITLE_WEIGHT
+            title_terms.update(set(title_tokens))
+            for term, tf in counts.items():
+                term_freqs[term].append((doc_id, tf))
+            doc_lengths[doc_id] = sum(counts.values())
+
+            location = normalize_location(job.get("location", ""))
+            location_codes[doc_id] = locations.setdefault(location, len(locations))
+            remote[doc_id] = bool(job.get("remote")) or location == REMOTE
+
+        avg_length = float(doc_lengths.mean()) if n_docs else 0.0
+        length_norm = K1 * (1 - B + B * doc_lengths / avg_length) if n_docs else doc_lengths
+
+        # Inverted index: term -> (doc ids, BM25 weight of the term in each doc)
+        self.postings = {}
+        for term, entries in term_freqs.items():
+            doc_ids = np.fromiter((d for d, _ in entries), dtype=np.int32, count=len(entries))
+            tfs = np.fromiter((tf for _, tf in entries), dtype=np.float32, count=len(entries))
+            idf = math.log(1 + (n_docs - len(entries) + 0.5) / (len(entries) + 0.5))
+            weights = idf * tfs * (K1 + 1) / (tfs + length_norm[doc_ids])
+            self.postings[term] = (doc_ids, weights.astype(np.float32))
+
+        # Facet indexes: location -> doc ids, plus the remote postings
+        self.location_names = [""] * len(locations)
+        for name, code in locations.items():
+            self.location_names[code] = name
+        self.location_codes = location_codes
+        order = np.argsort(location_codes, kind="stable").astype(np.int32)
+        bounds = np.searchsorted(location_codes[order], np.arange(len(locations) + 1))
+        self.location_index = {
+            name: order[bounds[code]:bounds[code + 1]] for name, code in locations.items()
+        }
+        self.remote = remote
+        self.remote_index = np.flatnonzero(remote).astype(np.int32)
+
+        # Autocomplete: sorted title vocabulary with document frequencies
+        self.completions = sorted(title_terms)
+        self.completion_counts = [title_terms[t] for t in self.completions]
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def _facet_docs(self, location):
+        """Doc ids allowed by the location filter (None means no filter)."""
+        location = normalize_location(location)
+        if not location:
+            return None
+        if location == REMOTE:
+            return self.remote_index
+        return self.location_index.get(location, np.empty(0, dtype=np.int32))
+
+    def search(self, keywords="", location=None, limit=10, cursor=None):
+        """
+        Search postings by keywords (BM25) with an optional location / 'remote' filter.
+        :param keywords: free text from the keyword box
+        :param location: city name or 'remote'
+        :param limit: page size
+        :param cursor: `next_cursor` from the previous page
+        :return: dict with 'results', 'total', 'next_cursor' and 'facets'
+        """
+        if limit < 1:
+            raise ValueError("limit must be positive.")
+
+        allowed = self._facet_docs(location)
+        # Fixed term order: float32 sums must not depend on set order (PYTHONHASHSEED),
+        # otherwise a cursor resumed in another process compares different scores
+        query_terms = sorted(set(tokenize(keywords)))
+        query_key = _query_key(query_terms, location)
+        terms = [t for t in query_terms if t in self.postings]
+
+        if terms:
+            scores = np.zeros(len(self.jobs), dtype=np.float32)
+            for term in terms:
+                doc_ids, weights = self.postings[term]
+                scores[doc_ids] += weights
+            matched = np.flatnonzero(scores).astype(np.int32)
+        elif tokenize(keywords):
+            scores = np.zeros(len(self.jobs), dtype=np.float32)
+            matched = np.empty(0, dtype=np.int32)
+        else:
+            # No keywords: browse the (filtered) catalog in posting order
+            scores = np.zeros(len(self.jobs), dtype=np.float32)
+            matched = np.arange(len(self.jobs), dtype=np.int32)
+
+        # Facets count keyword matches before the location filter, so the location
+        # control can still show how many postings every other location has
+        facets = {
+            "location": {
+                self.location_names[code]: int(count)
+                for code, count in enumerate(np.bincount(self.location_codes[matched], minlength=len(self.location_names)))
+                if count and self.location_names[code]
+            },
+            REMOTE: int(self.remote[matched].sum()),
+        }
+
+        if allowed is None:
+            doc_ids = matched
+        elif terms:
+            doc_ids = allowed[scores[allowed] > 0]
+        elif tokenize(keywords):
+            doc_ids = matched
+        else:
+            doc_ids = allowed
+        doc_scores = scores[doc_ids]
+        total = len(doc_ids)
+
+        # Results are ordered by (score desc, doc id asc); the cursor is the last item served
+        if cursor is not None:
+            last_score, last_id = _decode_cursor(cursor, query_key)
+            after = (doc_scores < last_score) | ((doc_scores == last_score) & (doc_ids > last_id))
+            doc_ids, doc_scores = doc_ids[after], doc_scores[after]
+
+        if len(doc_ids) > limit:
+            top = np.argpartition(-doc_scores, limit - 1)[:limit]
+            # Among items tied at the cut-off score, keep the lowest doc ids
+            cutoff = doc_scores[top].min()
+            above = np.flatnonzero(doc_scores > cutoff)
+            tied = np.flatnonzero(doc_scores == cutoff)
+            needed = limit - len(above)
+            tied = tied[np.argpartition(doc_ids[tied], needed - 1)[:needed]]
+            top = np.concatenate([above, tied])
+        else:
+            top = np.arange(len(doc_ids))
+        top = top[np.lexsort((doc_ids[top], -doc_scores[top]))][:limit]
+
+        results = [
+            dict(self.jobs[doc_id], id=int(doc_id), score=float(doc_scores[i]))
+            for i, doc_id in zip(top, doc_ids[top])
+        ]
+        has_more = len(doc_ids) > limit
+        next_cursor = _encode_cursor(results[-1]["score"], results[-1]["id"], query_key) if has_more else None
+
+        return {"results": results, "total": total, "next_cursor": next_cursor, "facets": facets}
+
+    def autocomplete(self, prefix, limit=5):
+        """
+        Complete the last word of the keyword box from title vocabulary.
+        :return: list of suggested keyword strings, most common first
+        """
+        words = tokenize(prefix)
+        if not words or prefix[-1:].isspace():
+            return []
+        head, last = words[:-1], words[-1]
+
+        start = bisect.bisect_left(self.completions, last)
+        end = bisect.bisect_left(self.completions, last + "\uffff", lo=start)
+        best = heapq.nsmallest(
+            limit, range(start, end), key=lambda i: (-self.completion_counts[i], self.completions[i])
+        )
+        return [" ".join(head + [self.completions[i]]) for i in best]
+
+
+def search_jobs(keywords="", location=None, limit=10, cursor=None, index=None):
+    """Search the bundled job catalog (see JobSearchIndex.search)."""
+    if index is None:
+        index = _default_index()
+    return index.search(keywords, location=location, limit=limit, cursor=cursor)
+
+
+_DEFAULT_INDEX = None
+
+
+def _default_index():
+    global _DEFAULT_INDEX
+    if _DEFAULT_INDEX is None:
+        _DEFAULT_INDEX = JobSearchIndex(load_jobs())
+    return _DEFAULT_INDEX
+
+
+if __name__ == "__main__":
+    # Latency benchmark over a synthetic 100k-posting catalog
+    import random
+    import time
+
+    rng = random.Random(0)
+    base_jobs = load_jobs()
+    vocabulary = sorted({t for job in base_jobs for t in tokenize(job["title"] + " " + job["description"])})
+    cities = ["Berlin", "London", "New York", "Bangalore", "Toronto", "Remote"]
+    jobs = [
+        {
+            "title": rng.choice(base_jobs)["title"],
+            "description": " ".join(rng.choices(vocabulary, k=40)),
+            "location": rng.choice(cities),
+        }
+        for _ in range(100_000)
+    ]
+
+    start = time.perf_counter()
+    index = JobSearchIndex(jobs)
+    print(f"Indexed {len(index)} postings in {time.perf_counter() - start:.2f}s")
+
+    timings = []
+    for _ in range(500):
+        keywords = " ".join(rng.choices(vocabulary, k=rng.randint(1, 3)))
+        location = rng.choice(cities + [None, None])
+        start = time.perf_counter()
+        index.search(keywords, location=location)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    print(f"search p50: {timings[len(timings) // 2]:.2f} ms  p95: {timings[int(len(timings) * 0.95)]:.2f} ms")
@@ -0,0 +1,221 @@
+# ai_models/result_store.py
+import json
+import os
+
+import numpy as np
+
+DICTIONARY_FILE = "dictionary.json"
+LOCK_FILE = "writer.lock"
+PART_PREFIX = "part-"
+NONE_ID = -1
+
+
+class _Dictionary:
+    """Append-only value <-> id mapping, so ids in earlier parts stay valid."""
+
+    def __init__(self, values=()):
+        self.values = list(values)
+        self.ids = {value: i for i, value in enumerate(self.values)}
+
+    def encode(self, value):
+        if value not in self.ids:
+            self.ids[value] = len(self.values)
+            self.values.append(value)
+        return self.ids[value]
+
+    def lookup(self, value):
+        return self.ids.get(value, NONE_ID)
+
+
+def _load_dictionaries(directory):
+    path = os.path.join(directory, DICTIONARY_FILE)
+    if not os.path.exists(path):
+        return {"skills": _Dictionary(), "jobs": _Dictionary(), "careers": _Dictionary()}
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return {name: _Dictionary(values) for name, values in data.items()}
+
+
+def _part_paths(directory):
+    return sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.startswith(PART_PREFIX) and name.endswith(".npz")
+    )
+
+
+def _next_part_number(directory):
+    """One past the highest existing part number, so gaps never lead to overwrites."""
+    numbers = [int(os.path.basename(path)[len(PART_PREFIX):-len(".npz")]) for path in _part_paths(directory)]
+    return max(numbers) + 1 if numbers else 0
+
+
+class ResultWriter:
+    """
+    Columnar writer for analyze_resume results. Rows are buffered and written in
+    chunks as .npz parts; skills, jobs and careers are stored as integer ids into
+    a shared dictionary, and list columns use CSR-style offsets.
+    Columns: skill_ids/skill_offsets, career_ids/career_offsets, top_job, top_score,
+    duplicate_of. The text preview and feedback string are not stored.
+
+    Only one writer may be open on a directory at a time (the dictionary is shared
+    by all parts); a writer.lock file enforces this. If a writer process crashed,
+    delete the stale writer.lock before opening a new one.
+    """
+
+    def __init__(self, directory, chunk_size=10000):
+        self.directory = directory
+        self.chunk_size = chunk_size
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock_path = os.path.join(directory, LOCK_FILE)
+        try:
+            fd = os.open(self._lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            raise RuntimeError(f"Another ResultWriter is open on: {directory} (remove {LOCK_FILE} if it crashed)")
+        with os.fdopen(fd, "w") as f:
+            f.write(str(os.getpid()))
+
+        # State is read under the lock so another writer can't change it meanwhile;
+        # if it can't be read (corrupt dictionary, stray part file), release the lock
+        try:
+            self.dictionaries = _load_dictionaries(directory)
+            self._next_part = _next_part_number(directory)
+        except Exception:
+            os.remove(self._lock_path)
+            raise
+        self._locked = True
+        self._buffer = []
+
+    def append(self, result):
+        """Buffer one analysis result; a part is written every `chunk_size` rows."""
+        if not self._locked:
+            raise ValueError("ResultWriter is closed.")
+        if "error" in result:
+            raise ValueError(f"Cannot store a failed analysis: {result['error']}")
+        self._buffer.append(result)
+        if len(self._buffer) >= self.chunk_size:
+            self.flush()
+
+    def extend(self, results):
+        for result in results:
+            self.append(result)
+
+    def flush(self):
+        """Write buffered rows as a new part and persist the dictionaries."""
+        if not self._buffer:
+            return
+        skills, jobs, careers = (self.dictionaries[name] for name in ("skills", "jobs", "careers"))
+
+        skill_ids, skill_offsets = [], [0]
+        career_ids, career_offsets = [], [0]
+        top_job, top_score, duplicate_of = [], [], []
+        for result in self._buffer:
+            skill_ids.extend(skills.encode(skill) for skill in result.get("skills", []))
+            skill_offsets.append(len(skill_ids))
+            career_ids.extend(careers.encode(c) for c in result.get("career_recommendations", []))
+            career_offsets.append(len(career_ids))
+
+            matches = result.get("job_matches") or []
+            top_job.append(jobs.encode(matches[0]["job"]) if matches else NONE_ID)
+            top_score.append(matches[0]["score"] if matches else np.nan)
+            duplicate = result.get("duplicate_of")
+            duplicate_of.append(duplicate if isinstance(duplicate, int) else NONE_ID)
+
+        # Dictionaries first: a part must never reference ids missing from disk
+        tmp_path = os.path.join(self.directory, DICTIONARY_FILE + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({name: d.values for name, d in self.dictionaries.items()}, f)
+        os.replace(tmp_path, os.path.join(self.directory, DICTIONARY_FILE))
+
+        part_path = os.path.join(self.directory, f"{PART_PREFIX}{self._next_part:05d}.npz")
+        if os.path.exists(part_path):
+            raise FileExistsError(f"Refusing to overwrite result part: {part_path}")
+        with open(part_path + ".tmp", "wb") as f:
+            np.savez(
+                f,
+                skill_ids=np.array(skill_ids, dtype=np.int32),
+                skill_offsets=np.array(skill_offsets, dtype=np.int64),
+                career_ids=np.array(career_ids, dtype=np.int32),
+                career_offsets=np.array(career_offsets, dtype=np.int64),
+                top_job=np.array(top_job, dtype=np.int32),
+                top_score=np.array(top_score, dtype=np.float32),
+                duplicate_of=np.array(duplicate_of, dtype=np.int64),
+            )
+        os.replace(part_path + ".tmp", part_path)
+
+        self._next_part += 1
+        self._buffer = []
+
+    def close(self):
+        """Write remaining rows and release the directory lock."""
+        if not self._locked:
+            return
+        try:
+            self.flush()
+        finally:
+            os.remove(self._lock_path)
+            self._locked = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _rows_with_all(ids, offsets, wanted, n_rows):
+    """Boolean mask of rows whose id list contains every id in `wanted`."""
+    mask = np.ones(n_rows, dtype=bool)
+    row_of = np.repeat(np.arange(n_rows), np.diff(offsets))
+    for value in wanted:
+        has = np.zeros(n_rows, dtype=bool)
+        has[row_of[ids == value]] = True
+        mask &= has
+    return mask
+
+
+class ResultStore:
+    """Read side of a ResultWriter directory; scans one part at a time."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.dictionaries = _load_dictionaries(directory)
+
+    def parts(self):
+        """Yield each part as a dict of column arrays."""
+        for path in _part_paths(self.directory):
+            with np.load(path) as part:
+                yield {name: part[name] for name in part.files}
+
+    def __len__(self):
+        return sum(len(part["top_job"]) for part in self.parts())
+
+    def count(self, skills=(), top_match=None):
+        """
+        Count analyses that have all of `skills` and, if given, `top_match` as best job.
+        e.g. store.count(skills=["python"], top_match="Backend Developer")
+        """
+        if isinstance(skills, str):
+            skills = [skills]
+        skill_ids = [self.dictionaries["skills"].lookup(skill) for skill in skills]
+        job_id = self.dictionaries["jobs"].lookup(top_match) if top_match is not None else None
+        if NONE_ID in skill_ids or job_id == NONE_ID:
+            return 0
+
+        total = 0
+        for part in self.parts():
+            n_rows = len(part["top_job"])
+            mask = _rows_with_all(part["skill_ids"], part["skill_offsets"], skill_ids, n_rows)
+            if job_id is not None:
+                mask &= part["top_job"] == job_id
+            total += int(mask.sum())
+        return total
+
+    def skill_counts(self):
+        """Number of analyses per skill, most common first."""
+        counts = np.zeros(len(self.dictionaries["skills"].values), dtype=np.int64)
+        for part in self.parts():
+            counts += np.bincount(part["skill_ids"], minlength=len(counts))
+        order = np.argsort(-counts, kind="stable")
+        return {self.dictionaries["skills"].values[i]: int(counts[i]) for i in order if counts[i]}
@@ -0,0 +1,199 @@
+# ai_models/resume_dedup.py
+import re
+import zlib
+
+import numpy as np
+
+# Mersenne prime used for the universal hash family (a * x + b) mod p
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+
+TOKEN_PATTERN = re.compile(r"[a-z][a-z0-9+#]*")
+
+
+def shingles(text, size=3):
+    """
+    Normalize text and split it into word shingles (n-grams of `size` words).
+    Case, punctuation and numbers are ignored so formatting noise doesn't matter.
+    """
+    if not isinstance(text, str):
+        return set()
+    words = TOKEN_PATTERN.findall(text.lower())
+    if len(words) < size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def _candidate_probability(similarity, bands, rows):
+    """Probability that two resumes with this Jaccard similarity share an LSH bucket."""
+    return 1.0 - (1.0 - similarity ** rows) ** bands
+
+
+def _optimal_bands(num_perm, threshold, recall=0.95, steps=200):
+    """
+    Pick (bands, rows) with bands * rows <= num_perm. A pair exactly at the
+    threshold must become a candidate with probability >= `recall`; among those
+    choices, take the one with the smallest false-positive area below the threshold
+    (integral of the candidate probability over [0, threshold]). False positives
+    only cost a signature comparison, a miss costs a full re-analysis.
+    """
+    below = (np.arange(steps) + 0.5) / steps * threshold
+    best = None
+    for bands in range(1, num_perm + 1):
+        for rows in range(1, num_perm // bands + 1):
+            if _candidate_probability(threshold, bands, rows) < recall:
+                continue
+            false_positive = _candidate_probability(below, bands, rows).mean() * threshold
+            if best is None or false_positive < best[0]:
+                best = (false_positive, bands, rows)
+    if best is None:
+        raise ValueError(
+            f"threshold {threshold} is too low: no LSH banding of {num_perm} permutations "
+            f"finds {recall:.0%} of pairs at that similarity. Raise the threshold or num_perm."
+        )
+    return best[1], best[2]
+
+
+class ResumeDeduplicator:
+    """
+    MinHash + LSH index of already-analyzed resumes. Near-duplicate lookups only
+    compare against resumes sharing an LSH bucket, so cost doesn't grow with the
+    number of indexed resumes. Candidates are accepted when their estimated
+    similarity (fraction of equal MinHash values) reaches the threshold; that
+    estimate is noisy, so pairs right at the threshold are accepted about half
+    the time, while clearly more similar pairs are almost always found.
+    """
+
+    def __init__(self, threshold=0.9, num_perm=128, shingle_size=3, seed=1):
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1].")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = _optimal_bands(num_perm, threshold)
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, np.iinfo(np.int64).max, size=num_perm, dtype=np.int64).astype(np.uint64)
+        self._b = rng.randint(0, np.iinfo(np.int64).max, size=num_perm, dtype=np.int64).astype(np.uint64)
+
+        self._buckets = [{} for _ in range(self.bands)]
+        self._signatures = []
+        self._keys = []
+        self._results = {}
+
+    def signature(self, text):
+        """Compute the MinHash signature of a resume text."""
+        hashes = np.array(
+            [zlib.crc32(s.encode("utf-8")) for s in shingles(text, self.shingle_size)],
+            dtype=np.uint64,
+        )
+        if hashes.size == 0:
+            return np.full(self.num_perm, MAX_HASH, dtype=np.uint64)
+        permuted = (np.outer(hashes, self._a) + self._b) % MERSENNE_PRIME & MAX_HASH
+        return permuted.min(axis=0)
+
+    def _band_keys(self, signature):
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def find(self, text, signature=None):
+        """
+        Look up a previously added near-duplicate of `text`.
+        :return: (key, estimated similarity) of the closest match, or None
+        """
+        if signature is None:
+            signature = self.signature(text)
+
+        candidates = set()
+        for band, band_key in zip(self._buckets, self._band_keys(signature)):
+            candidates.update(band.get(band_key, ()))
+
+        best = None
+        for entry_id in candidates:
+            similarity = float(np.mean(self._signatures[entry_id] == signature))
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (entry_id, similarity)
+        return (self._keys[best[0]], best[1]) if best else None
+
+    def add(self, text, result=None, key=None, signature=None):
+        """
+        Index a resume together with its analysis result.
+        :param key: identifier returned by find() for this resume (defaults to insertion order)
+        :return: key of the new resume
+        """
+        if signature is None:
+            signature = self.signature(text)
+
+        entry_id = len(self._signatures)
+        if key is None:
+            key = entry_id
+        self._signatures.append(signature)
+        self._keys.append(key)
+        self._results[key] = result
+        for band, band_key in zip(self._buckets, self._band_keys(signature)):
+            band.setdefault(band_key, []).append(entry_id)
+        return key
+
+    def result(self, key):
+        """Return the analysis result stored for a resume."""
+        return self._results[key]
+
+    def __len__(self):
+        return len(self._signatures)
+
+
+def dedup_analyze(texts, analyze, threshold=0.9, keys=None, deduplicator=None):
+    """
+    Run `analyze` on every text, reusing the result of an earlier near-duplicate
+    instead of re-analyzing it.
+    :param texts: iterable of resume texts
+    :param analyze: function text -> analysis result
+    :param threshold: estimated Jaccard similarity above which texts count as duplicates
+    :param keys: identifiers for the texts (defaults to their positions); must stay
+                 unique across runs when sharing a deduplicator
+    :param deduplicator: existing ResumeDeduplicator to share across runs
+    :return: (list of (result, duplicate_of) pairs, dedup report dict);
+             duplicate_of is the key of the resume whose result was reused, or None
+    """
+    if deduplicator is None:
+        deduplicator = ResumeDeduplicator(threshold=threshold)
+
+    outputs = []
+    duplicates = 0
+    texts = list(texts)
+    keys = range(len(texts)) if keys is None else keys
+    for key, text in zip(keys, texts):
+        signature = deduplicator.signature(text)
+        match = deduplicator.find(text, signature=signature)
+        if match is not None:
+            duplicates += 1
+            outputs.append((deduplicator.result(match[0]), match[0]))
+        else:
+            result = analyze(text)
+            deduplicator.add(text, result, key=key, signature=signature)
+            outputs.append((result, None))
+
+    total = len(outputs)
+    report = {
+        "total": total,
+        "analyzed": total - duplicates,
+        "duplicates": duplicates,
+        "dedup_rate": duplicates / total if total else 0.0,
+        "threshold": deduplicator.threshold,
+    }
+    return outputs, report
+
+
+if __name__ == "__main__":
+    import csv
+    import os
+    import sys
+
+    csv.field_size_limit(sys.maxsize)
+    dataset_path = os.path.join(os.path.dirname(__file__), "../models/NLP-ResumeScreening/UpdatedResumeDataSet.csv")
+    with open(dataset_path, encoding="utf-8", errors="replace", newline="") as f:
+        resumes = [row["Resume"] for row in csv.DictReader(f)]
+
+    _, report = dedup_analyze(resumes, analyze=lambda text: None)
+    print("📊 Dedup report:")
+    for key, value in report.items():
+        print(f"   {key}: {value}")
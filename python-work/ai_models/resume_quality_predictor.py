@@ -2,10 +2,14 @@
 
 import os
 import joblib
+from ai_models.job_index import current_version
 
 # Define paths to the cloned model files
-MODEL_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "../models/classifier1.pkl"))
-VECTORIZER_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "../models/vectorizer1.pkl"))
+MODEL_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "../models/NLP-ResumeScreening/classifier1.pkl"))
+VECTORIZER_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "../models/NLP-ResumeScreening/vectorizer1.pkl"))
+
+# Versions published by train_model.py; CURRENT names the active one
+MODEL_VERSIONS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../models/resume_classifier"))
 
 # Load model & vectorizer safely
 model = None
@@ -17,11 +21,48 @@ if os.path.exists(MODEL_PATH) and os.path.exists(VECTORIZER_PATH):
 else:
     print("[Warning] Pretrained model files not found. Model not loaded.")
 
+# (model, vectorizer, version) in use; replaced as a whole so concurrent callers
+# never pair a new classifier with an old vectorizer
+active_model = (model, vectorizer, None)
+failed_version = None
+
+def load_latest_model():
+    """
+    Hot-swap to the latest trained model version if it changed since the last call.
+    Returns the active (model, vectorizer, version) tuple; version is None while
+    the pretrained model is used.
+    """
+    global active_model, failed_version
+
+    current = active_model
+    version = current_version(MODEL_VERSIONS_DIR)
+    if version is None or version == current[2]:
+        return current
+
+    if version == failed_version:
+        return current
+
+    # Published artifacts are uncompressed joblib pickles: with mmap_mode their
+    # arrays (e.g. the sparse coef_) are mapped read-only and shared by all workers
+    version_dir = os.path.join(MODEL_VERSIONS_DIR, version)
+    try:
+        new_model = joblib.load(os.path.join(version_dir, "classifier.pkl"), mmap_mode="r")
+        new_vectorizer = joblib.load(os.path.join(version_dir, "vectorizer.pkl"), mmap_mode="r")
+    except Exception as e:
+        # Keep serving the current model; don't retry this version on every call
+        failed_version = version
+        print(f"[Warning] Could not load model version {version}: {e}")
+        return current
+    active_model = (new_model, new_vectorizer, version)
+    return active_model
+
 def predict_resume_quality(resume_text: str) -> str:
     """
-    Predict the resume category/quality using JeevikaaAnand's pretrained model.
+    Predict the resume category/quality using the latest trained model
+    (falls back to JeevikaaAnand's pretrained model).
     Returns a category label or error message if model is missing.
     """
+    model, vectorizer, _ = load_latest_model()
     if model is None or vectorizer is None:
         return "Model not available"
 
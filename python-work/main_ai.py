@@ -6,6 +6,7 @@ from ai_models.skills_extractor import extract_and_normalize
 from ai_models.job_matcher import match_jobs
 from ai_models.career_recommender import recommend_career
 from ai_models.feedback_generator import generate_feedback
+from ai_models.resume_dedup import dedup_analyze
 
 def analyze_resume(file_path: str):
     """Complete pipeline: parse → extract skills → match → recommend → feedback"""
@@ -15,6 +16,10 @@ def analyze_resume(file_path: str):
     # Step 1: Parse resume text
     parsed_text = parse_resume(file_path)
 
+    return analyze_resume_text(parsed_text)
+
+def analyze_resume_text(parsed_text: str):
+    """Pipeline on already-parsed text: extract skills → match → recommend → feedback"""
     # Step 2: Extract skills
     skills = extract_and_normalize(parsed_text)
 
@@ -36,6 +41,21 @@ def analyze_resume(file_path: str):
         "feedback": feedback
     }
 
+def analyze_resumes_bulk(texts, similarity_threshold: float = 0.9):
+    """
+    Analyze many parsed resumes, reusing results for near-duplicates (MinHash/LSH).
+    Returns (results, report) where report holds the dedup rate of the run.
+    """
+    texts = list(texts)
+    outputs, report = dedup_analyze(texts, analyze_resume_text, threshold=similarity_threshold)
+
+    results = []
+    for text, (result, duplicate_of) in zip(texts, outputs):
+        if duplicate_of is not None:
+            result = dict(result, parsed_text=text[:300] + "...", duplicate_of=duplicate_of)
+        results.append(result)
+    return results, report
+
 if __name__ == "__main__":
     
     test_file = r"C:\Users\Khushboo\OneDrive\Desktop.pdf"  
@@ -0,0 +1,115 @@
+# tests/test_job_index.py
+
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+from ai_models import job_index, job_matcher
+from ai_models.job_index import (
+    SharedJobIndex, build_job_index, current_version, new_version_name, prune_versions, publish_version,
+)
+from ai_models.job_matcher import JOB_LISTINGS, match_jobs
+
+def test_scores_match_tfidf_cosine(tmp_path):
+    build_job_index(JOB_LISTINGS, root=str(tmp_path))
+    index = SharedJobIndex(root=str(tmp_path))
+
+    resume_text = "Python developer with Docker, Flask and SQL experience"
+    matches = index.match({"raw_text": resume_text}, top_n=len(JOB_LISTINGS))
+
+    vectorizer = TfidfVectorizer()
+    job_matrix = vectorizer.fit_transform([job["description"] for job in JOB_LISTINGS])
+    expected = cosine_similarity(vectorizer.transform([resume_text]), job_matrix).flatten()
+    by_title = {job["title"]: score for job, score in zip(JOB_LISTINGS, expected)}
+
+    assert matches[0]["job"] == "Backend Developer"
+    for match in matches:
+        assert match["score"] == pytest.approx(by_title[match["job"]], abs=1e-5)
+
+def test_arrays_are_memory_mapped(tmp_path):
+    build_job_index(JOB_LISTINGS, root=str(tmp_path))
+    index = SharedJobIndex(root=str(tmp_path))
+
+    # CSR arrays must be read-only views of the mapped files, not private copies
+    for array in (index.matrix.data, index.matrix.indices, index.matrix.indptr):
+        assert not array.flags.owndata
+        assert not array.flags.writeable
+    assert isinstance(index.terms.blob, np.memmap)
+
+def test_refresh_picks_up_new_version(tmp_path):
+    first = build_job_index(JOB_LISTINGS[:2], root=str(tmp_path))
+    index = SharedJobIndex(root=str(tmp_path))
+    assert index.version == first
+
+    second = build_job_index(JOB_LISTINGS, root=str(tmp_path), keep=1)
+    assert current_version(str(tmp_path)) == second
+
+    matches = index.match("Kubernetes and AWS cloud deployment", top_n=1)
+    assert index.version == second
+    assert matches[0]["job"] == "DevOps Engineer"
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(["CURRENT", second])
+
+def test_unknown_words_score_zero(tmp_path):
+    build_job_index(JOB_LISTINGS, root=str(tmp_path))
+    index = SharedJobIndex(root=str(tmp_path))
+
+    assert all(m["score"] == 0.0 for m in index.match("zzz qqq", top_n=4))
+
+def test_vocabulary_handles_long_and_non_ascii_terms(tmp_path):
+    jobs = [
+        {"title": "Analyst", "description": "Café reporting " + "x" * 500},
+        {"title": "Engineer", "description": "Python services"},
+    ]
+    build_job_index(jobs, root=str(tmp_path))
+    index = SharedJobIndex(root=str(tmp_path))
+
+    assert index.terms.blob.size == sum(len(t.encode("utf-8")) for t in ["café", "python", "reporting", "services", "x" * 500])
+    assert index.terms.find("café") >= 0
+    assert index.terms.find("java") == -1
+    assert index.match("café reporting", top_n=1)[0]["job"] == "Analyst"
+
+def test_keep_must_be_positive(tmp_path):
+    with pytest.raises(ValueError):
+        build_job_index(JOB_LISTINGS, root=str(tmp_path), keep=0)
+
+def test_prune_skips_versions_in_use(tmp_path, monkeypatch):
+    first = build_job_index(JOB_LISTINGS, root=str(tmp_path))
+    second = build_job_index(JOB_LISTINGS, root=str(tmp_path))
+
+    # Simulate Windows refusing to delete a file mapped by another process
+    def locked_remove(path):
+        raise PermissionError(path)
+    monkeypatch.setattr(job_index.os, "remove", locked_remove)
+    prune_versions(str(tmp_path), keep=1)
+
+    assert (tmp_path / first).is_dir()
+    assert current_version(str(tmp_path)) == second
+
+def test_match_jobs_uses_published_index(tmp_path, monkeypatch):
+    monkeypatch.setattr(job_index, "INDEX_ROOT", str(tmp_path))
+    monkeypatch.setattr(job_matcher, "_shared_index", None)
+    assert job_matcher.get_shared_index() is None
+
+    jobs = [{"title": "Rust Engineer", "description": "Rust systems programming"}]
+    build_job_index(jobs, root=str(tmp_path))
+
+    assert match_jobs("rust systems programming", top_n=1) == [{"job": "Rust Engineer", "score": pytest.approx(1.0, abs=1e-5)}]
+    assert job_matcher.get_shared_index().root == str(tmp_path)
+
+def test_prune_never_removes_current_version(tmp_path):
+    for name in ["20260101T014500000000000-000000", "20260101T013000000000000-000000"]:
+        (tmp_path / name).mkdir()
+    # Published last but sorts first, e.g. after a clock step back
+    publish_version(str(tmp_path), "20260101T013000000000000-000000")
+
+    prune_versions(str(tmp_path), keep=1)
+
+    assert (tmp_path / current_version(str(tmp_path))).is_dir()
+
+def test_version_names_never_go_backwards(tmp_path, monkeypatch):
+    (tmp_path / "20990101T000000000000000-000004").mkdir()
+    name = new_version_name(str(tmp_path))
+
+    assert name == "20990101T000000000000000-000005"
+    monkeypatch.setattr(job_index.time, "time_ns", lambda: 4102444800 * 10 ** 9 + 1)
+    assert new_version_name(str(tmp_path)) == "21000101T000000000000001-000000"
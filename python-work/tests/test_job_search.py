@@ -0,0 +1,112 @@
+# tests/test_job_search.py
+
+import os
+import subprocess
+import sys
+import pytest
+from ai_models.job_search import JobSearchIndex, load_jobs, search_jobs
+
+JOBS = [
+    {"title": "Python Developer", "description": "Build APIs with Python and Flask", "location": "Berlin"},
+    {"title": "Data Scientist", "description": "Python, pandas and machine learning", "location": "London"},
+    {"title": "Frontend Developer", "description": "React and JavaScript", "location": "Remote"},
+    {"title": "DevOps Engineer", "description": "Docker, Kubernetes and Python tooling", "location": "Berlin", "remote": True},
+    {"title": "Data Engineer", "description": "Spark pipelines and SQL", "location": "new york"},
+]
+
+@pytest.fixture
+def index():
+    return JobSearchIndex(JOBS)
+
+def test_title_match_ranks_first(index):
+    response = index.search("python")
+    titles = [job["title"] for job in response["results"]]
+
+    assert titles[0] == "Python Developer"
+    assert set(titles) == {"Python Developer", "Data Scientist", "DevOps Engineer"}
+    assert response["total"] == 3
+
+def test_location_and_remote_facets(index):
+    berlin = index.search("python", location="berlin")
+    assert [job["id"] for job in berlin["results"]] == [0, 3]
+
+    remote = index.search("", location="Remote")
+    assert [job["id"] for job in remote["results"]] == [2, 3]
+
+    facets = index.search("python")["facets"]
+    assert facets["location"] == {"berlin": 2, "london": 1}
+    assert facets["remote"] == 1
+
+def test_location_facet_ignores_location_filter(index):
+    response = index.search("python", location="berlin")
+
+    assert response["total"] == 2
+    assert response["facets"]["location"] == {"berlin": 2, "london": 1}
+    assert response["facets"]["remote"] == 1
+    assert index.search("", location="london")["facets"]["location"] == {
+        "berlin": 2, "london": 1, "remote": 1, "new york": 1,
+    }
+
+def test_unknown_keyword_returns_nothing(index):
+    response = index.search("cobol")
+    assert response["results"] == [] and response["total"] == 0
+
+def test_cursor_pagination_covers_all_results(index):
+    seen = []
+    cursor = None
+    while True:
+        page = index.search("python data developer", limit=2, cursor=cursor)
+        seen.extend(job["id"] for job in page["results"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    full = index.search("python data developer", limit=10)
+    assert seen == [job["id"] for job in full["results"]]
+    assert len(seen) == len(set(seen)) == full["total"]
+
+def test_invalid_cursor(index):
+    with pytest.raises(ValueError):
+        index.search("python", cursor="not-a-cursor")
+
+def test_autocomplete_completes_last_word(index):
+    assert index.autocomplete("dat") == ["data"]
+    assert index.autocomplete("senior dev") == ["senior developer", "senior devops"]
+    assert index.autocomplete("data ") == []
+
+def test_search_bundled_catalog():
+    assert load_jobs()
+    response = search_jobs("machine learning python", limit=1)
+    assert response["results"][0]["title"] == "Machine Learning Engineer"
+
+SCORE_SCRIPT = """
+import json, random
+from ai_models.job_search import JobSearchIndex
+rng = random.Random(0)
+words = ["w%d" % i for i in range(300)]
+index = JobSearchIndex({"title": "job", "description": " ".join(rng.choices(words, k=30))} for _ in range(2000))
+queries = [" ".join(rng.sample(words, 4)) for _ in range(50)]
+print(json.dumps([[r["score"] for r in index.search(q, limit=20)["results"]] for q in queries]))
+"""
+
+def test_scores_do_not_depend_on_hash_seed():
+    outputs = []
+    for seed in ("1", "2", "3"):
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        result = subprocess.run([sys.executable, "-c", SCORE_SCRIPT], env=env, capture_output=True, text=True, check=True)
+        outputs.append(result.stdout)
+    assert outputs[0] == outputs[1] == outputs[2]
+
+def test_scores_do_not_depend_on_term_order(index):
+    first = index.search("python data developer", limit=10)["results"]
+    second = index.search("developer data python", limit=10)["results"]
+    assert [(r["id"], r["score"]) for r in first] == [(r["id"], r["score"]) for r in second]
+
+def test_cursor_from_another_search_is_rejected(index):
+    cursor = index.search("python data developer", limit=1)["next_cursor"]
+
+    assert index.search("developer python data", limit=1, cursor=cursor)["results"]
+    with pytest.raises(ValueError):
+        index.search("python", limit=1, cursor=cursor)
+    with pytest.raises(ValueError):
+        index.search("python data developer", location="berlin", limit=1, cursor=cursor)
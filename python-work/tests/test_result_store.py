@@ -0,0 +1,100 @@
+# tests/test_result_store.py
+
+import os
+import pytest
+from ai_models.result_store import ResultStore, ResultWriter
+from main_ai import analyze_resumes_bulk
+
+def make_result(skills, top_job, careers=()):
+    return {
+        "parsed_text": "...",
+        "skills": list(skills),
+        "job_matches": [{"job": top_job, "score": 0.5}] if top_job else [],
+        "career_recommendations": list(careers),
+        "feedback": "",
+    }
+
+def test_count_by_skill_and_top_match(tmp_path):
+    with ResultWriter(str(tmp_path), chunk_size=2) as writer:
+        writer.extend([
+            make_result(["python", "docker"], "Backend Developer"),
+            make_result(["python"], "Data Scientist"),
+            make_result(["docker"], "Backend Developer"),
+            make_result([], None),
+            make_result(["python", "sql"], "Backend Developer"),
+        ])
+
+    store = ResultStore(str(tmp_path))
+    assert len(store) == 5
+    assert len(list(store.parts())) == 3
+    assert store.count(skills="python", top_match="Backend Developer") == 2
+    assert store.count(skills=["python", "docker"]) == 1
+    assert store.count(top_match="Backend Developer") == 3
+    assert store.count(skills="rust") == 0
+    assert store.count(top_match="Astronaut") == 0
+    assert store.skill_counts() == {"python": 3, "docker": 2, "sql": 1}
+
+def test_append_across_writer_sessions(tmp_path):
+    with ResultWriter(str(tmp_path)) as writer:
+        writer.append(make_result(["python"], "Data Scientist"))
+    with ResultWriter(str(tmp_path)) as writer:
+        writer.append(make_result(["java", "python"], "Data Scientist"))
+
+    store = ResultStore(str(tmp_path))
+    assert store.count(skills="python", top_match="Data Scientist") == 2
+    assert store.count(skills="java") == 1
+
+def test_failed_analysis_is_rejected(tmp_path):
+    with ResultWriter(str(tmp_path)) as writer:
+        with pytest.raises(ValueError):
+            writer.append({"error": "File not found."})
+
+def test_missing_part_does_not_cause_overwrite(tmp_path):
+    with ResultWriter(str(tmp_path), chunk_size=1) as writer:
+        writer.extend(make_result([skill], "Data Scientist") for skill in ["python", "java", "sql"])
+    os.remove(tmp_path / "part-00000.npz")
+
+    with ResultWriter(str(tmp_path)) as writer:
+        writer.append(make_result(["go"], "Data Scientist"))
+
+    store = ResultStore(str(tmp_path))
+    assert sorted(p.name for p in tmp_path.glob("part-*.npz")) == ["part-00001.npz", "part-00002.npz", "part-00003.npz"]
+    assert store.skill_counts() == {"java": 1, "sql": 1, "go": 1}
+
+def test_second_writer_is_refused(tmp_path):
+    with ResultWriter(str(tmp_path)):
+        with pytest.raises(RuntimeError):
+            ResultWriter(str(tmp_path))
+
+    # Lock is released on close
+    with ResultWriter(str(tmp_path)) as writer:
+        writer.append(make_result(["python"], None))
+    assert not (tmp_path / "writer.lock").exists()
+
+@pytest.mark.parametrize("bad_file, content", [
+    ("part-abc.npz", ""),
+    ("dictionary.json", "{not json"),
+])
+def test_failed_setup_releases_lock(tmp_path, bad_file, content):
+    (tmp_path / bad_file).write_text(content)
+    with pytest.raises(ValueError):
+        ResultWriter(str(tmp_path))
+    assert not (tmp_path / "writer.lock").exists()
+
+    # Once the bad file is gone, the directory can be written again
+    os.remove(tmp_path / bad_file)
+    with ResultWriter(str(tmp_path)) as writer:
+        writer.append(make_result(["python"], None))
+    assert ResultStore(str(tmp_path)).skill_counts() == {"python": 1}
+
+def test_bulk_pipeline_results(tmp_path):
+    results, _ = analyze_resumes_bulk([
+        "Python developer with Flask, Django, SQL and Docker",
+        "Python developer with Flask, Django, SQL and Docker",
+    ])
+    with ResultWriter(str(tmp_path)) as writer:
+        writer.extend(results)
+
+    store = ResultStore(str(tmp_path))
+    assert store.count(skills=["python", "docker"], top_match=results[0]["job_matches"][0]["job"]) == 2
+    assert next(store.parts())["duplicate_of"].tolist() == [-1, 0]
@@ -0,0 +1,65 @@
+# tests/test_resume_dedup.py
+
+import pytest
+from ai_models.resume_dedup import ResumeDeduplicator, _candidate_probability, dedup_analyze, shingles
+from main_ai import analyze_resumes_bulk
+
+BASE_RESUME = (
+    "Software engineer with five years of experience building backend services in Python, "
+    "Flask and Django. Deployed containerized applications with Docker on AWS, designed SQL "
+    "schemas, wrote automated tests and mentored junior developers on code review practices."
+)
+
+def test_shingles_ignore_case_and_punctuation():
+    assert shingles("Python, Docker & AWS!") == shingles("python docker aws")
+
+def test_near_duplicate_is_found():
+    dedup = ResumeDeduplicator(threshold=0.8)
+    key = dedup.add(BASE_RESUME, result="first")
+
+    match = dedup.find(BASE_RESUME.upper() + "  ")
+    assert match is not None
+    assert match[0] == key
+    assert dedup.result(match[0]) == "first"
+
+def test_different_resume_is_not_a_duplicate():
+    dedup = ResumeDeduplicator(threshold=0.8)
+    dedup.add(BASE_RESUME)
+
+    assert dedup.find("Frontend developer skilled in React, JavaScript, HTML and CSS design systems.") is None
+
+@pytest.mark.parametrize("threshold", [0.8, 0.9, 0.95])
+def test_bands_favour_recall_at_threshold(threshold):
+    dedup = ResumeDeduplicator(threshold=threshold)
+
+    assert dedup.bands * dedup.rows <= dedup.num_perm
+    assert _candidate_probability(threshold, dedup.bands, dedup.rows) >= 0.95
+    assert _candidate_probability(threshold / 2, dedup.bands, dedup.rows) < 0.1
+
+@pytest.mark.parametrize("threshold", [0, 1.5, 0.02])
+def test_invalid_threshold(threshold):
+    with pytest.raises(ValueError):
+        ResumeDeduplicator(threshold=threshold)
+
+def test_dedup_analyze_reuses_results_and_reports_rate():
+    calls = []
+
+    def analyze(text):
+        calls.append(text)
+        return len(calls)
+
+    texts = [BASE_RESUME, "Data scientist using pandas and TensorFlow.", BASE_RESUME + "."]
+    outputs, report = dedup_analyze(texts, analyze, threshold=0.9)
+
+    assert len(calls) == 2
+    assert outputs == [(1, None), (2, None), (1, 0)]
+    assert report["duplicates"] == 1
+    assert report["dedup_rate"] == pytest.approx(1 / 3)
+
+def test_bulk_pipeline_marks_duplicates():
+    results, report = analyze_resumes_bulk([BASE_RESUME, BASE_RESUME.lower()])
+
+    assert report["analyzed"] == 1
+    assert "duplicate_of" not in results[0]
+    assert results[1]["duplicate_of"] == 0
+    assert results[1]["skills"] == results[0]["skills"]
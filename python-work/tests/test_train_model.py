@@ -0,0 +1,114 @@
+# tests/test_train_model.py
+
+import os
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+import scipy.sparse as sp
+import train_model
+from ai_models import resume_quality_predictor
+
+ROWS = {
+    "Data Science": "Python pandas numpy machine learning statistics regression models",
+    "Web Designing": "HTML CSS JavaScript responsive layouts Photoshop user interface",
+    "HR": "Recruitment onboarding payroll employee relations interviews policies",
+}
+
+@pytest.fixture
+def dataset(tmp_path):
+    # Sorted by category like UpdatedResumeDataSet.csv
+    rows = [(category, f"{text} resume {i}") for category, text in ROWS.items() for i in range(40)]
+    path = tmp_path / "resumes.csv"
+    pd.DataFrame(rows, columns=["Category", "Resume"]).to_csv(path, index=False)
+    return str(path)
+
+def test_shuffled_batches_keep_every_row(dataset):
+    chunks = train_model.read_chunks(dataset, chunk_size=25)
+    batches = list(train_model.shuffled_batches(chunks, batch_size=16, buffer_size=50))
+
+    labels = [label for _, batch_labels in batches for label in batch_labels]
+    assert len(labels) == 120
+    assert all(len(texts) <= 16 for texts, _ in batches)
+    assert len(set(batches[0][1])) > 1
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_train_streams_and_learns(dataset, n_jobs):
+    classifier, vectorizer, stats = train_model.train(dataset, chunk_size=25, batch_size=16, epochs=3, n_jobs=n_jobs, n_features=2 ** 12)
+
+    assert stats["rows"] == 120
+    assert stats["classes"] == sorted(ROWS)
+    assert 0.0 <= stats["progressive_accuracy"] <= 1.0
+    prediction = classifier.predict(vectorizer.transform(["pandas numpy regression"]))
+    assert prediction[0] == "Data Science"
+
+def test_cli_publishes_version_and_predictor_hot_swaps(dataset, tmp_path, monkeypatch):
+    output = tmp_path / "versions"
+    assert train_model.main(["--data", dataset, "--output", str(output), "--chunk-size", "25", "--epochs", "3"]) == 0
+
+    version = (output / "CURRENT").read_text()
+    assert os.path.exists(output / version / "classifier.pkl")
+    assert os.path.exists(output / version / "metadata.json")
+
+    monkeypatch.setattr(resume_quality_predictor, "MODEL_VERSIONS_DIR", str(output))
+    monkeypatch.setattr(resume_quality_predictor, "active_model", resume_quality_predictor.active_model)
+    monkeypatch.setattr(resume_quality_predictor, "failed_version", None)
+    assert resume_quality_predictor.predict_resume_quality("recruitment payroll interviews") == "HR"
+    assert resume_quality_predictor.active_model[2] == version
+    assert isinstance(resume_quality_predictor.active_model[0].coef_.data, np.memmap)
+
+def test_published_model_is_sparse_float32_and_pruned(dataset, tmp_path):
+    output = tmp_path / "versions"
+    for _ in range(3):
+        assert train_model.main(["--data", dataset, "--output", str(output), "--chunk-size", "25", "--epochs", "1", "--keep", "2"]) == 0
+
+    versions = sorted(p.name for p in output.iterdir() if p.is_dir())
+    assert len(versions) == 2
+    assert versions[-1] == (output / "CURRENT").read_text()
+
+    classifier = joblib.load(output / versions[-1] / "classifier.pkl")
+    assert sp.issparse(classifier.coef_)
+    assert classifier.coef_.dtype == np.float32
+    assert os.path.getsize(output / versions[-1] / "classifier.pkl") < 1_000_000
+
+def test_pretrained_model_fallback(monkeypatch, tmp_path):
+    monkeypatch.setattr(resume_quality_predictor, "MODEL_VERSIONS_DIR", str(tmp_path))
+    assert resume_quality_predictor.model is not None
+    assert resume_quality_predictor.predict_resume_quality("Python pandas numpy machine learning data science") == "Data Science"
+
+def test_cli_missing_dataset(tmp_path):
+    assert train_model.main(["--data", str(tmp_path / "missing.csv")]) == 1
+
+@pytest.mark.parametrize("rows, extra_args", [
+    ([("HR", "payroll")], ["--epochs", "0"]),
+    ([], []),
+    ([("HR", "payroll"), ("HR", "recruitment")], []),
+])
+def test_cli_rejects_untrainable_input(tmp_path, rows, extra_args):
+    path = tmp_path / "resumes.csv"
+    pd.DataFrame(rows, columns=["Category", "Resume"]).to_csv(path, index=False)
+
+    assert train_model.main(["--data", str(path), "--output", str(tmp_path / "versions")] + extra_args) == 1
+    assert not (tmp_path / "versions").exists()
+
+def test_publish_model_leaves_classifier_dense(dataset, tmp_path):
+    classifier, vectorizer, stats = train_model.train(dataset, chunk_size=25, epochs=1, n_features=2 ** 12)
+    coef = classifier.coef_
+    train_model.publish_model(classifier, vectorizer, stats, versions_dir=str(tmp_path))
+
+    assert classifier.coef_ is coef
+    assert not sp.issparse(classifier.coef_)
+
+def test_unloadable_version_keeps_current_model(dataset, tmp_path, monkeypatch):
+    output = tmp_path / "versions"
+    assert train_model.main(["--data", dataset, "--output", str(output), "--chunk-size", "25", "--epochs", "1"]) == 0
+    monkeypatch.setattr(resume_quality_predictor, "MODEL_VERSIONS_DIR", str(output))
+    monkeypatch.setattr(resume_quality_predictor, "active_model", resume_quality_predictor.active_model)
+    monkeypatch.setattr(resume_quality_predictor, "failed_version", None)
+    assert resume_quality_predictor.predict_resume_quality("recruitment payroll interviews") == "HR"
+    good = resume_quality_predictor.active_model
+
+    (output / "CURRENT").write_text("missing-version")
+
+    assert resume_quality_predictor.predict_resume_quality("recruitment payroll interviews") == "HR"
+    assert resume_quality_predictor.active_model is good
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Out-of-core Training for the Resume Category Classifier
+This script streams UpdatedResumeDataSet.csv-format data (Category, Resume) in
+chunks, so memory use does not depend on the size of the corpus, and publishes a
+versioned model that resume_quality_predictor picks up without a restart.
+"""
+
+import argparse
+import copy
+import json
+import os
+import random
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+
+from ai_models.job_index import new_version_name, prune_versions, publish_version
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DATASET = os.path.join(BASE_DIR, "models", "NLP-ResumeScreening", "UpdatedResumeDataSet.csv")
+MODEL_VERSIONS_DIR = os.path.join(BASE_DIR, "models", "resume_classifier")
+DEFAULT_N_FEATURES = 2 ** 18
+
+
+def make_vectorizer(n_features=DEFAULT_N_FEATURES):
+    """
+    Stateless vectorizer: no vocabulary to fit, so any chunk can be transformed independently.
+    float32 output matches the float32 sparse coefficients of published models.
+    """
+    return HashingVectorizer(
+        n_features=n_features,
+        stop_words="english",
+        alternate_sign=False,
+        norm="l2",
+        dtype=np.float32,
+    )
+
+
+def read_chunks(csv_path, chunk_size, columns=("Category", "Resume")):
+    """Yield DataFrame chunks of a Category/Resume CSV without loading the whole file."""
+    for chunk in pd.read_csv(csv_path, usecols=list(columns), chunksize=chunk_size, encoding_errors="replace"):
+        yield chunk.dropna()
+
+
+def read_classes(csv_path, chunk_size):
+    """First streaming pass: collect the label set that partial_fit needs up front."""
+    classes = set()
+    for chunk in read_chunks(csv_path, chunk_size, columns=("Category",)):
+        classes.update(chunk["Category"].astype(str))
+    return np.array(sorted(classes))
+
+
+def shuffled_batches(chunks, batch_size, buffer_size, seed=0):
+    """
+    Re-batch rows through a bounded shuffle buffer. The bundled dataset is sorted
+    by category, which would otherwise feed SGD one class at a time.
+    """
+    rng = random.Random(seed)
+    buffer = []
+
+    def pop_batch(size):
+        batch = []
+        for _ in range(min(size, len(buffer))):
+            i = rng.randrange(len(buffer))
+            buffer[i], buffer[-1] = buffer[-1], buffer[i]
+            batch.append(buffer.pop())
+        return [text for text, _ in batch], [label for _, label in batch]
+
+    for chunk in chunks:
+        buffer.extend(zip(chunk["Resume"].astype(str), chunk["Category"].astype(str)))
+        while len(buffer) >= buffer_size + batch_size:
+            yield pop_batch(batch_size)
+    while buffer:
+        yield pop_batch(batch_size)
+
+
+def _vectorize(vectorizer, texts):
+    return vectorizer.transform(texts)
+
+
+def vectorized_batches(batches, vectorizer, n_jobs=1):
+    """
+    Yield (X, labels) per batch. With n_jobs > 1 batches are vectorized in worker
+    processes, keeping at most 2 * n_jobs batches in flight.
+    """
+    if n_jobs <= 1:
+        for texts, labels in batches:
+            yield vectorizer.transform(texts), labels
+        return
+
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        pending = deque()
+        for texts, labels in batches:
+            pending.append((executor.submit(_vectorize, vectorizer, texts), labels))
+            if len(pending) >= 2 * n_jobs:
+                future, labels = pending.popleft()
+                yield future.result(), labels
+        while pending:
+            future, labels = pending.popleft()
+            yield future.result(), labels
+
+
+def train(csv_path, chunk_size=500, batch_size=256, buffer_size=5000, epochs=5, n_jobs=1, n_features=DEFAULT_N_FEATURES, seed=0, classes=None):
+    """
+    Train a linear classifier with partial_fit over streamed batches.
+    Returns (classifier, vectorizer, stats) where stats holds the progressive
+    validation accuracy of the first epoch: each batch is scored before the model
+    learns from it. Later epochs revisit rows the model has already seen, so
+    their accuracy would only measure training fit and isn't reported.
+    :param classes: label set, if already known (otherwise read from the CSV)
+    """
+    if epochs < 1:
+        raise ValueError("epochs must be at least 1.")
+    vectorizer = make_vectorizer(n_features)
+    if classes is None:
+        classes = read_classes(csv_path, chunk_size)
+    if len(classes) < 2:
+        raise ValueError(f"Need at least 2 categories to train, found {len(classes)}.")
+    classifier = SGDClassifier(loss="log_loss", alpha=1e-5, random_state=seed)
+
+    stats = {"rows": 0, "progressive_accuracy": None}
+    correct = seen = 0
+    for epoch in range(epochs):
+        batches = shuffled_batches(read_chunks(csv_path, chunk_size), batch_size, buffer_size, seed=seed + epoch)
+        for X, labels in vectorized_batches(batches, vectorizer, n_jobs=n_jobs):
+            if epoch == 0:
+                if stats["rows"]:
+                    correct += int((classifier.predict(X) == np.array(labels)).sum())
+                    seen += len(labels)
+                stats["rows"] += len(labels)
+            classifier.partial_fit(X, labels, classes=classes)
+
+        if epoch == 0:
+            stats["progressive_accuracy"] = correct / seen if seen else None
+            print(f"   Epoch 1/{epochs}: progressive accuracy = {stats['progressive_accuracy']}")
+        else:
+            print(f"   Epoch {epoch + 1}/{epochs} done")
+
+    stats["classes"] = classes.tolist()
+    return classifier, vectorizer, stats
+
+
+def publish_model(classifier, vectorizer, metadata, versions_dir=MODEL_VERSIONS_DIR, keep=2):
+    """
+    Write model artifacts into a new version directory, then atomically point
+    CURRENT at it so running predictors swap to the new model. Coefficients are
+    stored as a float32 sparse matrix: the hashing space is mostly unused, so a
+    dense coef_ would be classes x n_features floats on disk and in every worker.
+    The caller's classifier is left untouched (a copy is sparsified).
+    :param keep: number of versions to keep on disk (older ones are removed)
+    :return: name of the published version
+    """
+    if keep < 1:
+        raise ValueError("keep must be at least 1.")
+
+    classifier = copy.deepcopy(classifier).sparsify()
+    classifier.coef_ = classifier.coef_.astype(np.float32)
+
+    os.makedirs(versions_dir, exist_ok=True)
+    version = new_version_name(versions_dir)
+    version_dir = os.path.join(versions_dir, version)
+    os.makedirs(version_dir)
+
+    joblib.dump(classifier, os.path.join(version_dir, "classifier.pkl"))
+    joblib.dump(vectorizer, os.path.join(version_dir, "vectorizer.pkl"))
+    with open(os.path.join(version_dir, "metadata.json"), "w", encoding="utf-8") as f:
+        json.dump(dict(metadata, version=version), f, indent=2)
+
+    publish_version(versions_dir, version)
+    prune_versions(versions_dir, keep)
+    return version
+
+
+def main(argv=None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Retrain the resume category classifier out of core.")
+    parser.add_argument("--data", default=DEFAULT_DATASET, help="CSV with Category and Resume columns")
+    parser.add_argument("--output", default=MODEL_VERSIONS_DIR, help="directory holding model versions")
+    parser.add_argument("--chunk-size", type=int, default=500, help="rows read from the CSV at a time")
+    parser.add_argument("--batch-size", type=int, default=256, help="rows per partial_fit call")
+    parser.add_argument("--buffer-size", type=int, default=5000, help="rows held in the shuffle buffer")
+    parser.add_argument("--epochs", type=int, default=5)
+    parser.add_argument("--jobs", type=int, default=1, help="processes used for vectorization")
+    parser.add_argument("--n-features", type=int, default=DEFAULT_N_FEATURES, help="hashing space size")
+    parser.add_argument("--keep", type=int, default=2, help="model versions kept on disk")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.data):
+        print(f"❌ Dataset not found: {args.data}")
+        return 1
+    if args.epochs < 1:
+        print(f"❌ --epochs must be at least 1 (got {args.epochs})")
+        return 1
+    if args.keep < 1:
+        print(f"❌ --keep must be at least 1 (got {args.keep})")
+        return 1
+
+    classes = read_classes(args.data, args.chunk_size)
+    if len(classes) < 2:
+        print(f"❌ Need at least 2 categories to train, found {len(classes)} in {args.data}")
+        return 1
+
+    print(f"🧠 Training on {args.data}")
+    classifier, vectorizer, stats = train(
+        args.data,
+        chunk_size=args.chunk_size,
+        batch_size=args.batch_size,
+        buffer_size=args.buffer_size,
+        epochs=args.epochs,
+        n_jobs=args.jobs,
+        n_features=args.n_features,
+        seed=args.seed,
+        classes=classes,
+    )
+    metadata = dict(stats, dataset=os.path.abspath(args.data), epochs=args.epochs, n_features=args.n_features)
+    version = publish_model(classifier, vectorizer, metadata, versions_dir=args.output, keep=args.keep)
+    print(f"✅ Trained on {stats['rows']} rows, published model version {version}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())